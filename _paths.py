@@ -0,0 +1,19 @@
+"""Project root discovery shared by secret_manager modules."""
+
+import functools
+from pathlib import Path
+
+
+def project_root() -> Path:
+    """Return the project root for the current working directory."""
+    return _find_project_root(Path.cwd())
+
+
+@functools.cache
+def _find_project_root(start: Path) -> Path:
+    """Find the project root by looking for init.yaml or .git above start."""
+    for parent in [start, *start.parents]:
+        if (parent / "init.yaml").exists() or (parent / ".git").exists():
+            return parent
+
+    return start
@@ -4,10 +4,10 @@ import os
 import sys
 from pathlib import Path
 
-SCRIPT_DIR = Path(__file__).parent.resolve()
 PROJECT_ROOT = Path.cwd()
 
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
 
 from managers.secret_manager.secret_cli import register_cli
 
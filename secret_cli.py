@@ -1,11 +1,37 @@
 """CLI commands and registration for secret_manager."""
 
 import argparse
+import functools
 import getpass
+import os
 import sys
+from typing import TYPE_CHECKING, Optional
 
-from managers.secret_manager.secret_manager import SecretManager
-from managers.cli_manager import CLIManager, ModuleRegistration, Command, CommandArg
+if TYPE_CHECKING:
+    from managers.secret_manager.secret_manager import SecretManager
+
+
+# (name, help, handler function, positional args)
+_COMMANDS = (
+    ("list", "List all secret keys", "list_secrets", ()),
+    ("get", "Get a secret value", "get_secret", ("key",)),
+    ("set", "Set a secret value", "set_secret", ("key",)),
+    ("delete", "Delete a secret", "delete_secret", ("key",)),
+)
+_COMMAND_SPECS = {spec[0]: spec for spec in _COMMANDS}
+
+
+_SM: Optional["SecretManager"] = None
+
+
+def _sm() -> "SecretManager":
+    """Return the SecretManager shared by all handlers, creating it on first use."""
+    global _SM
+    if _SM is None:
+        from managers.secret_manager.secret_manager import SecretManager
+
+        _SM = SecretManager()
+    return _SM
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -14,12 +40,10 @@ from managers.cli_manager import CLIManager, ModuleRegistration, Command, Comman
 
 def list_secrets(args: argparse.Namespace) -> int:
     """List all secret keys."""
-    sm = SecretManager()
+    sm = _sm()
     keys = sm.list_secrets()
     if keys:
-        print("Secrets:")
-        for k in keys:
-            print(f"  - {k}")
+        sys.stdout.write("Secrets:\n" + "".join(f"  - {k}\n" for k in keys))
     else:
         print("No secrets found.")
     return 0
@@ -27,7 +51,7 @@ def list_secrets(args: argparse.Namespace) -> int:
 
 def get_secret(args: argparse.Namespace) -> int:
     """Get a secret value."""
-    sm = SecretManager()
+    sm = _sm()
     val = sm.get_secret(args.key)
     if val is not None:
         print(val)
@@ -39,7 +63,7 @@ def get_secret(args: argparse.Namespace) -> int:
 
 def set_secret(args: argparse.Namespace) -> int:
     """Set a secret value."""
-    sm = SecretManager()
+    sm = _sm()
     val = getpass.getpass(f"Enter value for '{args.key}': ")
     if not val:
         print("Aborted: Empty value.")
@@ -51,7 +75,7 @@ def set_secret(args: argparse.Namespace) -> int:
 
 def delete_secret(args: argparse.Namespace) -> int:
     """Delete a secret."""
-    sm = SecretManager()
+    sm = _sm()
     if sm.delete_secret(args.key):
         print(f"Secret '{args.key}' deleted.")
         return 0
@@ -66,6 +90,8 @@ def delete_secret(args: argparse.Namespace) -> int:
 
 def register_cli() -> None:
     """Register secret_manager commands with CLIManager."""
+    from managers.cli_manager import CLIManager, ModuleRegistration, Command, CommandArg
+
     cli = CLIManager()
     cli.register_module(ModuleRegistration(
         module_name="secret_manager",
@@ -73,34 +99,69 @@ def register_cli() -> None:
         description="Manage secrets securely",
         commands=[
             Command(
-                name="list",
-                help="List all secret keys",
-                handler="managers.secret_manager.secret_cli:list_secrets",
-            ),
-            Command(
-                name="get",
-                help="Get a secret value",
-                handler="managers.secret_manager.secret_cli:get_secret",
-                args=[
-                    CommandArg(name="key", help="The secret key"),
-                ],
-            ),
-            Command(
-                name="set",
-                help="Set a secret value",
-                handler="managers.secret_manager.secret_cli:set_secret",
-                args=[
-                    CommandArg(name="key", help="The secret key"),
-                ],
-            ),
-            Command(
-                name="delete",
-                help="Delete a secret",
-                handler="managers.secret_manager.secret_cli:delete_secret",
-                args=[
-                    CommandArg(name="key", help="The secret key"),
-                ],
-            ),
+                name=name,
+                help=help_text,
+                handler=f"managers.secret_manager.secret_cli:{handler}",
+                args=[CommandArg(name=arg, help="The secret key") for arg in args],
+            )
+            for name, help_text, handler, args in _COMMANDS
         ],
     ))
 
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Standalone Entry Point
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _add_command_args(parser: argparse.ArgumentParser, args: tuple[str, ...]) -> None:
+    """Add a command's positional arguments to a parser."""
+    for arg in args:
+        parser.add_argument(arg, help="The secret key")
+
+
+@functools.cache
+def _build_command_parser(name: str) -> argparse.ArgumentParser:
+    """Build (once per process) the parser for a single subcommand."""
+    _, help_text, _, args = _COMMAND_SPECS[name]
+    parser = argparse.ArgumentParser(
+        prog=f"{os.path.basename(sys.argv[0])} {name}",
+        description=help_text,
+    )
+    _add_command_args(parser, args)
+    return parser
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build (once per process) the full parser, used for help and errors."""
+    parser = argparse.ArgumentParser(description="Manage secrets securely")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, help_text, _, args in _COMMANDS:
+        _add_command_args(subparsers.add_parser(name, help=help_text), args)
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the secret_manager CLI without going through CLIManager.
+
+    Only the requested subcommand's parser is built, and SecretManager is
+    imported by its handler, so e.g. `get KEY` touches nothing else.
+    Parsers are reused across calls in long-lived processes.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+
+    if argv and argv[0] in _COMMAND_SPECS:
+        command, parsed = argv[0], _build_command_parser(argv[0]).parse_args(argv[1:])
+    else:
+        # No or unknown subcommand, or top-level -h/--help: let the full parser report it
+        parsed = _build_parser().parse_args(argv)
+        command = parsed.command
+
+    return globals()[_COMMAND_SPECS[command][2]](parsed)
+
+
+if __name__ == "__main__":
+    # Allow running as a script from the project root
+    if os.getcwd() not in sys.path:
+        sys.path.append(os.getcwd())
+    sys.exit(main())
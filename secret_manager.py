@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import copy
 import os
 from pathlib import Path
-from typing import Any, Optional
-
-import yaml
+from typing import Any, BinaryIO, Callable, KeysView, Optional
 
 from cores.exceptions_core.adhd_exceptions import ADHDError
-from managers.ignore_manager import IgnoreManager
-from utils.logger_util import Logger
+from managers.secret_manager._paths import project_root
+
+# (mtime_ns, size, inode, ctime_ns) of the secrets file. A rename or any
+# metadata change alters the inode or ctime, so copies can't go silently stale.
+_StatKey = tuple[int, int, int, int]
 
 
 class SecretNotIgnoredError(ADHDError):
@@ -26,10 +28,16 @@ class SecretManager:
     """
 
     DEFAULT_SECRETS_PATH = "project/data/secrets.yaml"
-    SECRETS_PATTERNS = [
+    SECRETS_PATTERNS = frozenset({
         "project/data/secrets.yaml",
         "project/data/secrets.*.yaml",
-    ]
+    })
+    # Temp files, JSON sidecar and key index beside the default secrets file.
+    # Ensured alongside SECRETS_PATTERNS but never grants write permission.
+    COMPANION_PATTERN = "project/data/secrets.yaml.*"
+
+    # (project root, secrets path) pairs whose patterns are already ensured
+    _ensured_paths: set[tuple[Path, Path]] = set()
 
     def __init__(
         self,
@@ -42,19 +50,43 @@ class SecretManager:
             secrets_path: Custom path to secrets file. Defaults to project/data/secrets.yaml.
             auto_ensure_ignored: If True, automatically add secrets to .gitignore on init.
         """
+        # Deferred so importing this module stays cheap
+        from managers.ignore_manager import IgnoreManager
+        from utils.logger_util import Logger
+
         self.logger = Logger(name=__class__.__name__)
         self._ignore_manager = IgnoreManager()
 
+        # Parsed secrets, valid while the file's stat key matches
+        self._cache: Optional[dict[str, Any]] = None
+        self._cache_stat: Optional[_StatKey] = None
+
+        # Key names read from the index file, valid for the same stat as _cache
+        self._keys: Optional[dict[str, None]] = None
+        self._keys_stat: Optional[_StatKey] = None
+
         # Resolve secrets path
+        self._project_root = project_root()
         if secrets_path:
             self.secrets_path = Path(secrets_path)
         else:
-            self.secrets_path = self._find_project_root() / self.DEFAULT_SECRETS_PATH
+            self.secrets_path = self._project_root / self.DEFAULT_SECRETS_PATH
+
+        # Path used for ignore checks; falls back to the filename outside the project
+        self._relative_secrets = self._relative_to_project(self.secrets_path)
+
+        # JSON copy of the secrets, faster to load than the YAML source of truth
+        self._sidecar_path = self.secrets_path.with_name(self.secrets_path.name + ".cache")
+        # Plain-text list of key names, so listing keys skips value parsing
+        self._index_path = self.secrets_path.with_name(self.secrets_path.name + ".keys")
 
         # Ensure secrets are ignored on init
         if auto_ensure_ignored:
             self._ensure_secrets_ignored()
 
+        # Gitignore rarely changes mid-process; checked once, re-checked on failure
+        self.refresh_protection()
+
     # ---------------- Public API ----------------
 
     def get_secret(self, key: str, default: Any = None) -> Any:
@@ -68,7 +100,10 @@ class SecretManager:
             The secret value, or default if not found.
         """
         secrets = self._load_secrets()
-        return secrets.get(key, default)
+        if key not in secrets:
+            return default
+        # Copied so callers can't mutate the cache (and, via the next save, the file)
+        return copy.deepcopy(secrets[key])
 
     def set_secret(self, key: str, value: Any) -> None:
         """Set a secret value.
@@ -82,7 +117,7 @@ class SecretManager:
         """
         self._validate_ignored_before_write()
 
-        secrets = self._load_secrets()
+        secrets = dict(self._load_secrets())
         secrets[key] = value
         self._save_secrets(secrets)
         self.logger.info(f"Secret '{key}' saved")
@@ -101,7 +136,7 @@ class SecretManager:
         """
         self._validate_ignored_before_write()
 
-        secrets = self._load_secrets()
+        secrets = dict(self._load_secrets())
         if key not in secrets:
             self.logger.debug(f"Secret '{key}' not found")
             return False
@@ -117,8 +152,7 @@ class SecretManager:
         Returns:
             List of secret key names.
         """
-        secrets = self._load_secrets()
-        return list(secrets.keys())
+        return list(self._load_keys())
 
     def has_secret(self, key: str) -> bool:
         """Check if a secret exists.
@@ -129,8 +163,7 @@ class SecretManager:
         Returns:
             True if the secret exists.
         """
-        secrets = self._load_secrets()
-        return key in secrets
+        return key in self._load_keys()
 
     def get_multiple(self, keys: list[str]) -> dict[str, Any]:
         """Get multiple secrets at once.
@@ -142,7 +175,7 @@ class SecretManager:
             Dict mapping keys to values (missing keys have None values).
         """
         secrets = self._load_secrets()
-        return {key: secrets.get(key) for key in keys}
+        return {key: copy.deepcopy(secrets.get(key)) for key in keys}
 
     def is_protected(self) -> bool:
         """Check if secrets file is properly gitignored.
@@ -150,48 +183,80 @@ class SecretManager:
         Returns:
             True if secrets file is in the gitignore managed zone.
         """
-        return self._ignore_manager.is_ignored(str(self.secrets_path.relative_to(self._find_project_root())))
+        return self._ignore_manager.is_ignored(self._relative_secrets)
 
-    # ---------------- Internal helpers ----------------
+    def refresh_protection(self) -> bool:
+        """Re-check gitignore protection for writes, e.g. after editing .gitignore.
 
-    def _find_project_root(self) -> Path:
-        """Find the project root by looking for init.yaml or .git."""
-        current = Path.cwd()
+        Also re-checks the JSON sidecar and key index, which are only written
+        while they are ignored too.
 
-        for parent in [current] + list(current.parents):
-            if (parent / "init.yaml").exists() or (parent / ".git").exists():
-                return parent
+        Returns:
+            True if writes to the secrets file are allowed.
+        """
+        self._is_protected_cached = self._compute_protection()
+        self._sidecar_protected = self._is_companion_ignored(self._sidecar_path)
+        self._index_protected = self._is_companion_ignored(self._index_path)
+        return self._is_protected_cached
 
-        return current
+    # ---------------- Internal helpers ----------------
 
     def _ensure_secrets_ignored(self) -> None:
-        """Ensure all secrets patterns are in .gitignore."""
-        for pattern in self.SECRETS_PATTERNS:
+        """Ensure all secrets patterns are in .gitignore.
+
+        Runs once per project and secrets file per process; later instances skip it.
+        """
+        ensured_key = (self._project_root, self.secrets_path)
+        if ensured_key in SecretManager._ensured_paths:
+            return
+
+        # Sorted so patterns land in .gitignore in a stable order
+        patterns = sorted(self.SECRETS_PATTERNS | {self.COMPANION_PATTERN})
+        missing = [p for p in patterns if not self._ignore_manager.is_ignored(p)]
+        for pattern in missing:
             self._ignore_manager.ensure_ignored(pattern)
-        self.logger.debug("Secrets patterns added to .gitignore managed zone")
+        if missing:
+            self.logger.debug("Secrets patterns added to .gitignore managed zone")
 
-    def _validate_ignored_before_write(self) -> None:
-        """Validate that secrets file is ignored before any write operation."""
+        SecretManager._ensured_paths.add(ensured_key)
+
+    def _compute_protection(self) -> bool:
+        """Check whether the secrets file is ignored, via patterns or its own path."""
         # Check if any of our patterns are in the managed zone
         for pattern in self.SECRETS_PATTERNS:
             if self._ignore_manager.is_ignored(pattern):
-                return  # At least one pattern is ignored, we're safe
+                return True  # At least one pattern is ignored, we're safe
 
         # Also check if the secrets filename itself is ignored
         if self._ignore_manager.is_ignored(self.secrets_path.name):
-            return
+            return True
+
+        # Check the project-relative path (or filename, outside the project)
+        if self._ignore_manager.is_globally_ignored(self._relative_secrets):
+            return True
+
+        return False
+
+    def _is_companion_ignored(self, path: Path) -> bool:
+        """Check that a file stored next to the secrets file is gitignored too."""
+        # The managed companion pattern only covers the default secrets file
+        default_path = self._project_root / self.DEFAULT_SECRETS_PATH
+        if self.secrets_path == default_path and self._ignore_manager.is_ignored(self.COMPANION_PATTERN):
+            return True
+        return self._ignore_manager.is_globally_ignored(self._relative_to_project(path))
 
-        # Try to check relative path if within project root
+    def _relative_to_project(self, path: Path) -> str:
+        """Return path relative to the project root, or its filename outside it."""
         try:
-            project_root = self._find_project_root()
-            relative_path = str(self.secrets_path.relative_to(project_root))
-            if self._ignore_manager.is_globally_ignored(relative_path):
-                return
+            return str(path.relative_to(self._project_root))
         except ValueError:
-            # secrets_path is not under project root (e.g., temp directory)
-            # Check if just the filename is globally ignored
-            if self._ignore_manager.is_globally_ignored(self.secrets_path.name):
-                return
+            return path.name
+
+    def _validate_ignored_before_write(self) -> None:
+        """Validate that secrets file is ignored before any write operation."""
+        # A stale negative is re-checked so a freshly added ignore rule is honoured
+        if self._is_protected_cached or self.refresh_protection():
+            return
 
         raise SecretNotIgnoredError(
             f"SECURITY: Secrets file '{self.secrets_path}' is NOT in .gitignore! "
@@ -202,25 +267,214 @@ class SecretManager:
         """Ensure the parent directory exists."""
         self.secrets_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def _stat_key(self) -> Optional[_StatKey]:
+        """Return the stat key of the secrets file, or None if missing."""
+        try:
+            st = self.secrets_path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns)
+
     def _load_secrets(self) -> dict[str, Any]:
-        """Load secrets from YAML file."""
-        if not self.secrets_path.exists():
+        """Load secrets from YAML file.
+
+        The parsed dict is cached and reused until the file's stat key
+        changes. Callers must not mutate the returned dict.
+        """
+        stat_key = self._stat_key()
+        if stat_key is None:
+            self._cache = None
+            self._cache_stat = None
             return {}
 
+        if self._cache is not None and self._cache_stat == stat_key:
+            return self._cache
+
+        data = self._load_sidecar(stat_key)
+        if data is None:
+            import yaml
+
+            # Prefer libyaml's C loader when PyYAML was built with it
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            try:
+                content = self.secrets_path.read_bytes()
+                data = yaml.load(content, Loader=loader)
+            except yaml.YAMLError as e:
+                self.logger.error(f"Failed to parse secrets file: {e}")
+                return {}
+
+        self._cache = data if isinstance(data, dict) else {}
+        self._cache_stat = stat_key
+        return self._cache
+
+    def _load_keys(self) -> KeysView[Any]:
+        """Load secret key names, from the index file when it is current."""
+        stat_key = self._stat_key()
+        if stat_key is None:
+            return {}.keys()
+
+        if self._cache is not None and self._cache_stat == stat_key:
+            return self._cache.keys()
+        if self._keys is not None and self._keys_stat == stat_key:
+            return self._keys.keys()
+
+        keys = self._load_index(stat_key)
+        if keys is None:
+            return self._load_secrets().keys()
+
+        self._keys = dict.fromkeys(keys)
+        self._keys_stat = stat_key
+        return self._keys.keys()
+
+    def _load_index(self, stat_key: _StatKey) -> Optional[list[str]]:
+        """Read the key index if it was written for this YAML file."""
+        if not self._index_protected:
+            return None
+
+        # Decoded from bytes: text mode would also split lines on "\r"
         try:
-            content = self.secrets_path.read_text(encoding="utf-8")
-            data = yaml.safe_load(content)
-            return data if isinstance(data, dict) else {}
-        except yaml.YAMLError as e:
-            self.logger.error(f"Failed to parse secrets file: {e}")
-            return {}
+            content = self._index_path.read_bytes().decode("utf-8")
+        except (OSError, ValueError):
+            return None
+
+        # First line is the YAML stat the index mirrors, then one key per line
+        header, _, body = content.partition("\n")
+        if header != " ".join(map(str, stat_key)):
+            return None
+        return body.split("\n")[:-1]
+
+    def _load_sidecar(self, stat_key: _StatKey) -> Optional[dict[str, Any]]:
+        """Load secrets from the JSON sidecar if it was written for this YAML file."""
+        import json
+
+        if not self._sidecar_protected:
+            return None
+
+        try:
+            data = json.loads(self._sidecar_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        # The sidecar records the YAML stat it mirrors; any other edit invalidates it
+        if not isinstance(data, dict) or data.get("stat") != list(stat_key):
+            return None
+        secrets = data.get("secrets")
+        return secrets if isinstance(secrets, dict) else None
 
     def _save_secrets(self, secrets: dict[str, Any]) -> None:
-        """Save secrets to YAML file."""
+        """Save secrets to YAML file, plus its JSON sidecar."""
+        import yaml
+
         self._ensure_parent_dir()
 
-        content = yaml.dump(secrets, default_flow_style=False, allow_unicode=True)
-        self.secrets_path.write_text(content, encoding="utf-8")
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        st = self._atomic_write(
+            self.secrets_path,
+            lambda f: yaml.dump(
+                secrets,
+                stream=f,
+                Dumper=dumper,
+                default_flow_style=False,
+                allow_unicode=True,
+                encoding="utf-8",
+            ),
+        )
+        if st is None:
+            # The file on disk is no longer ours; don't mirror or cache our data
+            self._sidecar_path.unlink(missing_ok=True)
+            self._index_path.unlink(missing_ok=True)
+            self._cache = None
+            self._cache_stat = None
+            return
+
+        stat_key = (st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns)
+        self._save_sidecar(secrets, stat_key)
+        self._save_index(secrets, stat_key)
 
-        # Restrict permissions to owner only (0600)
-        os.chmod(self.secrets_path, 0o600)
+        # Cache a private copy in the order the dumper wrote (sort_keys),
+        # matching a fresh reload; the caller still holds the stored values
+        secrets = copy.deepcopy(secrets)
+        try:
+            self._cache = dict(sorted(secrets.items()))
+        except TypeError:
+            self._cache = secrets
+        self._cache_stat = stat_key
+
+    def _save_sidecar(self, secrets: dict[str, Any], stat_key: _StatKey) -> None:
+        """Write the JSON sidecar; YAML stays the source of truth if this fails."""
+        import json
+
+        # Never leave a plaintext copy of secrets where git could pick it up.
+        # JSON would also silently stringify non-str keys, dates, etc.
+        if not self._sidecar_protected or not _is_json_safe(secrets):
+            self._sidecar_path.unlink(missing_ok=True)
+            return
+
+        payload = json.dumps(
+            {"stat": list(stat_key), "secrets": secrets},
+            ensure_ascii=False,
+            sort_keys=True,
+        ).encode("utf-8")
+        try:
+            self._atomic_write(self._sidecar_path, lambda f: f.write(payload))
+        except OSError as e:
+            self.logger.debug(f"Failed to write secrets sidecar: {e}")
+
+    def _save_index(self, secrets: dict[str, Any], stat_key: _StatKey) -> None:
+        """Write the key index; listing falls back to the YAML file if this fails."""
+        # Key names are sensitive too; keep them out of unignored files
+        if not self._index_protected or not all(isinstance(k, str) and "\n" not in k for k in secrets):
+            self._index_path.unlink(missing_ok=True)
+            return
+
+        lines = [" ".join(map(str, stat_key)), *sorted(secrets)]
+        payload = "".join(f"{line}\n" for line in lines).encode("utf-8")
+        try:
+            self._atomic_write(self._index_path, lambda f: f.write(payload))
+        except OSError as e:
+            self.logger.debug(f"Failed to write secrets key index: {e}")
+
+    def _atomic_write(self, path: Path, write: Callable[[BinaryIO], Any]) -> Optional[os.stat_result]:
+        """Write a file via a sibling temp file and rename it into place.
+
+        The file is owner-only (0600) from creation and is never left
+        truncated or half-written.
+
+        Returns:
+            The stat of the file after it was renamed into place, or None if
+            another writer replaced it before it could be taken.
+        """
+        import tempfile
+
+        # Unique per write (created 0600), so concurrent saves never share a temp file
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+                f.flush()
+                os.fsync(f.fileno())
+                ino = os.fstat(f.fileno()).st_ino
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        # Taken after the rename, which updates the inode's ctime. If another
+        # writer has already replaced the file, its stat must not tag our data.
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st if st.st_ino == ino else None
+
+
+def _is_json_safe(value: Any) -> bool:
+    """Check that a value round-trips through JSON unchanged."""
+    if value is None or isinstance(value, (str, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_is_json_safe(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_json_safe(v) for k, v in value.items())
+    return False